@@ -1,40 +1,200 @@
+from __future__ import annotations # Keeps the TelemetryFrame annotations valid on Python < 3.10
 import tkinter as tk
 from tkinter import ttk, messagebox
 import serial
 import serial.tools.list_ports
 import threading
+import queue
 import time
-from collections import deque
+import math
+import re
+import logging
+from dataclasses import dataclass
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.ticker import NullLocator
 from mpl_toolkits.mplot3d import Axes3D # Required for 3D plotting
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 import numpy as np # For numerical operations, especially vector math
-from scipy.spatial.transform import Rotation as R # For quaternion to rotation matrix conversion
-import traceback # For detailed error reporting
+
+# --- LOGGING ---
+class RateLimitedHandler(logging.Handler):
+    """
+    Forwards records to another handler, letting through only the first record logged from
+    each message template (e.g. one parse error, whatever the line) per `window` seconds.
+    Once the window has passed, the number of records dropped is reported, with the last
+    dropped message, on the next emit() or flush().
+    Records below `min_level`, such as the sent-command trace, are always forwarded.
+    This keeps a stream of malformed packets from stalling the GUI on terminal writes.
+    """
+    def __init__(self, target, window=0.5, min_level=logging.WARNING):
+        super().__init__()
+        self.target = target
+        self.window = window
+        self.min_level = min_level
+        # (logger, level, template) -> [time.monotonic() of last forward, records dropped since, last dropped record]
+        self.last_forwarded = {}
+
+    def emit(self, record):
+        if record.levelno < self.min_level:
+            self.target.handle(record)
+            return
+        now = time.monotonic()
+        self.report_expired(now)
+        key = (record.name, record.levelno, record.msg)
+        entry = self.last_forwarded.get(key)
+        if entry is not None:
+            # Still inside the window of the last forwarded record from this template
+            entry[1] += 1
+            entry[2] = record
+            return
+        self.last_forwarded[key] = [now, 0, None]
+        self.target.handle(record)
+
+    def report_expired(self, now):
+        """Forgets templates whose window has passed, reporting any records dropped within it."""
+        for key, (last_time, dropped, last_dropped) in list(self.last_forwarded.items()):
+            if now - last_time < self.window:
+                continue
+            del self.last_forwarded[key]
+            if dropped:
+                self.target.handle(logging.makeLogRecord({
+                    "name": last_dropped.name, "levelno": last_dropped.levelno,
+                    "levelname": last_dropped.levelname,
+                    "msg": "...suppressed %d similar messages, the last: %s",
+                    "args": (dropped, last_dropped.getMessage())}))
+
+    def flush(self):
+        """Reports records dropped in bursts that have ended, then flushes the target handler."""
+        with self.lock:
+            self.report_expired(time.monotonic())
+        self.target.flush()
+
+stream_handler = logging.StreamHandler()
+stream_handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+log = logging.getLogger("groundstation")
+rate_limited_handler = RateLimitedHandler(stream_handler)
+log.addHandler(rate_limited_handler)
+log.setLevel(logging.INFO)
 
 # --- GLOBALS ---
 ser = None # Serial port object
 running = False # Flag to control the serial reading thread
 
-# Deque to store the latest quaternion data. Maxlen=1 means it only keeps the very last one.
-# SciPy's Rotation.from_quat() expects quaternions in [x, y, z, w] order.
+# Array holding the latest quaternion, overwritten in place for every DATA line.
+# Quaternions are stored in [x, y, z, w] order (see quat_to_basis_vectors), in float32 like the trail,
+# which is well beyond the precision of the IMU data.
 # Initialize with a default quaternion representing no rotation (identity quaternion: x=0, y=0, z=0, w=1)
-latest_quaternion = deque([np.array([0, 0, 0, 1])], maxlen=1)
+latest_quaternion = np.array([0.0, 0.0, 0.0, 1.0], dtype=np.float32)
 
-# Deques to store position data for the trail. Maxlen controls the trail length.
-# At 50ms update rate, maxlen=500 means 25 seconds of history.
-x_positions = deque(maxlen=500)
-y_positions = deque(maxlen=500)
-z_positions = deque(maxlen=500)
+class TrailBuffer:
+    """
+    Preallocated ring buffer storing the position trail as one row per axis (x, y and z,
+    each contiguous), which keeps the trail's bounding box up to date as positions are
+    appended. The box is only rescanned when a position on its edge falls out of the buffer.
+    Every position is also mirrored `length` columns further along, so the trail in order
+    is always one contiguous slice of each row.
+    """
+    def __init__(self, length):
+        self.length = length
+        self.positions = np.empty((3, 2 * length), dtype=np.float32)
+        self.mins = np.empty(3, dtype=np.float32)
+        self.maxs = np.empty(3, dtype=np.float32)
+        self.clear()
+
+    def clear(self):
+        self.write_idx = 0 # Total number of positions written; the next column is write_idx % length
+        self.mins.fill(np.inf)
+        self.maxs.fill(-np.inf)
+        self.bounds_stale = False
+
+    def __len__(self):
+        return min(self.write_idx, self.length)
+
+    def append(self, position):
+        idx = self.write_idx % self.length
+        column = self.positions[:, idx]
+        if self.write_idx >= self.length and not self.bounds_stale:
+            # The oldest position is about to be overwritten; if it was on the edge of
+            # the bounding box the box may shrink, so rescan on the next read
+            self.bounds_stale = bool(np.any(column == self.mins) or np.any(column == self.maxs))
+        column[:] = position
+        self.positions[:, idx + self.length] = column
+        self.write_idx += 1
+        if not self.bounds_stale:
+            np.minimum(self.mins, column, out=self.mins)
+            np.maximum(self.maxs, column, out=self.maxs)
+
+    def bounds(self):
+        """Returns copies of the (mins, maxs) corners of the trail's bounding box."""
+        if self.bounds_stale:
+            filled = self.positions[:, :len(self)]
+            filled.min(axis=1, out=self.mins)
+            filled.max(axis=1, out=self.maxs)
+            self.bounds_stale = False
+        return self.mins.copy(), self.maxs.copy()
+
+    def ordered(self):
+        """Returns a view of the trail as a (3, N) array, oldest position first."""
+        if self.write_idx < self.length:
+            return self.positions[:, :self.write_idx]
+        start = self.write_idx % self.length
+        return self.positions[:, start:start + self.length]
+
+# TRAIL_LENGTH controls the trail length. At 50ms update rate, 500 means 25 seconds of history.
+TRAIL_LENGTH = 500
+position_trail = TrailBuffer(TRAIL_LENGTH)
+# GUI-side copy of the trail the position line is drawn from, refilled in place from each snapshot
+trail_snapshot = np.empty((3, TRAIL_LENGTH), dtype=np.float32)
+
+# Guards latest_quaternion, the trail and engine_states together, so the GUI never sees a
+# quaternion from one DATA line paired with a position or engine state from another
+telemetry_lock = threading.Lock()
+# Set by the serial thread when the attitude, the trail or the engine states change,
+# cleared once get_telemetry_snapshot has handed them to the GUI
+attitude_dirty = True
+position_dirty = True
+engines_dirty = True
+
+@dataclass
+class TelemetryFrame:
+    """
+    Consistent snapshot of the telemetry shared with the serial thread, taken under
+    telemetry_lock by get_telemetry_snapshot. Fields are None when that part of the
+    telemetry did not change since the previous snapshot.
+    """
+    quaternion: list | None # [x, y, z, w]
+    trail: np.ndarray | None # (3, N) view of trail_snapshot, oldest position first
+    trail_bounds: tuple | None # (mins, maxs) bounding box of the trail
+    engine_states: int | None # Engine on/off bitmask
 
 start_time = None # To track the start time of data reception
 
-# Engine states (3 engines: 0, 1, 2)
-# Initialize all engines to off (False)
-engine_states = [False] * 3 # Changed to 3 engines
-
-# Deque to store raw serial lines
-raw_serial_lines = deque(maxlen=200) # Store up to 200 lines for display
+# Engine telemetry (3 engines: 0, 1, 2), one record per engine in a single contiguous buffer
+# Initialize all engines with zeroed metrics. Nothing parses these from serial yet, so the metric
+# labels are only drawn at startup and on disconnect; once they are parsed, give them a dirty flag
+# and carry them in TelemetryFrame like engine_states.
+engine_telemetry = np.zeros(3, dtype=[
+    ('servo1', 'f4'),   # Servo angle 1 (degrees)
+    ('servo2', 'f4'),   # Servo angle 2 (degrees)
+    ('throttle', 'f4'), # Throttle (%)
+    ('thrust', 'f4')    # Thrust (N)
+])
+engine_states = 0 # Engine on/off states as a bitmask, bit i set while engine i is on; all off initially
+
+# Raw serial lines handed from the serial thread to the GUI, drained in batches by update_plot
+raw_line_queue = queue.Queue(maxsize=1000)
+RAW_DISPLAY_MAX_LINES = 200 # Keep up to 200 lines in the raw data display
+RAW_DISPLAY_INTERVAL = 0.1 # Refresh the raw data display at most 10 times per second
+last_raw_display_time = 0.0
+raw_lines_shown = 0 # Number of lines currently in the raw data display
+
+# The GUI updates when the serial thread signals new data instead of polling on a timer
+UPDATE_MIN_INTERVAL = 0.033 # Update the GUI at most ~30 times per second under load
+CLOCK_INTERVAL_MS = 250 # The date, time and flight time labels tick on their own timer
+serial_event_pending = False # A <<SerialData>> event has been posted and not yet handled
+update_scheduled = False # update_plot is already scheduled to run
+last_update_time = 0.0
 
 # --- GUI SETUP ---
 root = tk.Tk()
@@ -266,17 +426,19 @@ cx = canvas_width // 2
 cy = r + 15          # Vertical offset for top engine
 triangle_height = int((3**0.5) / 2 * side)
 
-# Draw the three engines in an equilateral triangle
-engine_canvas.create_oval(cx - r, cy - r, cx + r, cy + r,
-                          outline=LIGHT_TEXT_COLOR, width=2, fill=DARK_BG_COLOR, tags="eng0")
 bl_x = cx - side // 2
 bl_y = cy + triangle_height
-engine_canvas.create_oval(bl_x - r, bl_y - r, bl_x + r, bl_y + r,
-                          outline=LIGHT_TEXT_COLOR, width=2, fill=DARK_BG_COLOR, tags="eng1")
 br_x = cx + side // 2
 br_y = bl_y
-engine_canvas.create_oval(br_x - r, br_y - r, br_x + r, br_y + r,
-                          outline=LIGHT_TEXT_COLOR, width=2, fill=DARK_BG_COLOR, tags="eng2")
+engine_centers = [(cx, cy), (bl_x, bl_y), (br_x, br_y)] # Top, bottom-left, bottom-right
+
+# Draw the three engines in an equilateral triangle.
+# Keep the item ids so state updates address the ovals directly instead of looking up tags.
+engine_item_ids = [
+    engine_canvas.create_oval(ex - r, ey - r, ex + r, ey + r,
+                              outline=LIGHT_TEXT_COLOR, width=2, fill=DARK_BG_COLOR, tags=f"eng{i}")
+    for i, (ex, ey) in enumerate(engine_centers)
+]
 
 
 # --- Engine Metrics Section ---
@@ -325,13 +487,12 @@ for i in range(3):
     lbl.grid(row=4, column=i+1, padx=2, pady=2)
     thrust_labels.append(lbl)
 
-# --- 3D Plotting Setup (Each plot in its own LabelFrame) ---
-# Main frame to hold both plot frames side-by-side
+# --- 3D Plotting Setup (Both plots share one figure and canvas) ---
+# Main frame to hold the plot canvas
 plots_main_frame = ttk.Frame(root, style='TFrame')
 plots_main_frame.grid(row=2, column=1, padx=10, pady=5, sticky="nsew") # Placed in right column, no rowspan
 plots_main_frame.grid_columnconfigure(0, weight=1)
 plots_main_frame.grid_rowconfigure(0, weight=1)
-plots_main_frame.grid_rowconfigure(1, weight=1)
 
 # --- Raw Serial Data Display Section ---
 raw_data_frame = ttk.LabelFrame(root, text="Raw Serial Data", style='TLabelframe')
@@ -363,31 +524,37 @@ raw_data_text.config(xscrollcommand=raw_data_scrollbar_x.set)
 # Define plot background color to match the dark theme
 PLOT_BG_COLOR = DARK_BG_COLOR # Now truly dark
 
-# Attitude Plot Frame
-attitude_plot_frame = ttk.LabelFrame(plots_main_frame, text="Attitude Visualization", style='Flat.TLabelframe')
-attitude_plot_frame.grid(row=0, column=0, padx=5, pady=5, sticky="nsew") # Grid within plots_main_frame
-attitude_plot_frame.grid_rowconfigure(0, weight=1)
-attitude_plot_frame.grid_columnconfigure(0, weight=1)
-
-# Create a matplotlib figure for the Attitude plot (slightly smaller figsize)
-fig_attitude = plt.figure(figsize=(1.8, 1.8))
-# Set figure background color to match the LabelFrame
-fig_attitude.patch.set_facecolor(PLOT_BG_COLOR)
-ax_attitude = fig_attitude.add_subplot(111, projection='3d')
-# Set axes background color to match the LabelFrame
-ax_attitude.set_facecolor(PLOT_BG_COLOR)
-canvas_attitude = FigureCanvasTkAgg(fig_attitude, master=attitude_plot_frame)
+def strip_3d_axes(ax):
+    """
+    Removes per-draw mplot3d work that has no visible effect on these tick-less plots:
+    tick locators (ticks are computed and drawn even with empty labels and zero length)
+    and the depth sort of collections (the only collections are blitted separately).
+    """
+    for axis in (ax.xaxis, ax.yaxis, ax.zaxis):
+        axis.set_major_locator(NullLocator())
+    ax.computed_zorder = False
+
+# Create a single matplotlib figure holding the Attitude plot above the Position plot,
+# so one canvas, renderer and draw serve both
+fig_plots = plt.figure(figsize=(2.0, 4.0))
+# Set figure background color to match the frame
+fig_plots.patch.set_facecolor(PLOT_BG_COLOR)
+canvas_plots = FigureCanvasTkAgg(fig_plots, master=plots_main_frame)
 # Apply highlightthickness to the Tkinter widget returned by get_tk_widget()
-canvas_attitude_tk_widget = canvas_attitude.get_tk_widget()
-canvas_attitude_tk_widget.config(highlightthickness=0) # Set it here
-canvas_attitude_tk_widget.grid(row=0, column=0, sticky="nsew", padx=2, pady=2)
+canvas_plots_tk_widget = canvas_plots.get_tk_widget()
+canvas_plots_tk_widget.config(highlightthickness=0) # Set it here
+canvas_plots_tk_widget.grid(row=0, column=0, sticky="nsew", padx=2, pady=2)
 
+# Attitude Plot
+ax_attitude = fig_plots.add_subplot(211, projection='3d')
+# Set axes background color to match the frame
+ax_attitude.set_facecolor(PLOT_BG_COLOR)
 
-# Remove axis labels and titles
+# Remove axis labels, keep a title in place of the former LabelFrame
 ax_attitude.set_xlabel("")
 ax_attitude.set_ylabel("")
 ax_attitude.set_zlabel("")
-ax_attitude.set_title("")
+ax_attitude.set_title("Attitude Visualization", color=LIGHT_TEXT_COLOR, fontsize=10, fontweight='bold')
 ax_attitude.set_xticklabels([]) # Remove tick labels
 ax_attitude.set_yticklabels([])
 ax_attitude.set_zticklabels([])
@@ -397,57 +564,57 @@ ax_attitude.set_ylim([-1, 1])
 ax_attitude.set_zlim([-1, 1])
 ax_attitude.set_aspect('equal')
 ax_attitude.grid(False) # Remove grid
+strip_3d_axes(ax_attitude)
 
-initial_vectors = {
-    'x': np.array([1, 0, 0]),
-    'y': np.array([0, 1, 0]),
-    'z': np.array([0, 0, 1])
-}
-
-quiver_x = ax_attitude.quiver(0, 0, 0, 0, 0, 0, color='r', length=0.8, arrow_length_ratio=0.1)
-quiver_y = ax_attitude.quiver(0, 0, 0, 0, 0, 0, color='g', length=0.8, arrow_length_ratio=0.1)
-quiver_z = ax_attitude.quiver(0, 0, 0, 0, 0, 0, color='b', length=0.8, arrow_length_ratio=0.1)
-
-
-# Position Plot Frame
-position_plot_frame = ttk.LabelFrame(plots_main_frame, text="Position Trail", style='Flat.TLabelframe')
-position_plot_frame.grid(row=1, column=0, padx=5, pady=5, sticky="nsew") # Grid within plots_main_frame
-position_plot_frame.grid_rowconfigure(0, weight=1)
-position_plot_frame.grid_columnconfigure(0, weight=1)
-
-# Create a matplotlib figure for the Position plot (slightly smaller figsize)
-fig_position = plt.figure(figsize=(2.0, 2.0))
-# Set figure background color to match the LabelFrame
-fig_position.patch.set_facecolor(PLOT_BG_COLOR)
-ax_position = fig_position.add_subplot(111, projection='3d')
-# Set axes background color to match the LabelFrame
+ARROW_LENGTH = 0.8 # Length of the attitude axis arrows
+ARROW_HEAD_RATIO = 0.1 # Arrowhead length as a fraction of the arrow length
+
+# All three axis arrows live in one collection: a shaft and two arrowhead segments per arrow,
+# colored red/green/blue for x/y/z. It is animated so full draws leave it out of the cached
+# blitting background, and it is created once with its segments updated in place every frame.
+# The collection keeps a reference to attitude_segments, a (9 segments, 2 points, xyz) array
+# rewritten in place by arrow_segments; the shaft origins stay at zero.
+attitude_segments = np.zeros((9, 2, 3))
+attitude_arrows = Line3DCollection(attitude_segments, colors=['r'] * 3 + ['g'] * 3 + ['b'] * 3, animated=True)
+ax_attitude.add_collection3d(attitude_arrows, autolim=False)
+
+
+# Position Plot
+ax_position = fig_plots.add_subplot(212, projection='3d')
+# Set axes background color to match the frame
 ax_position.set_facecolor(PLOT_BG_COLOR)
-canvas_position = FigureCanvasTkAgg(fig_position, master=position_plot_frame)
-# Apply highlightthickness to the Tkinter widget returned by get_tk_widget()
-canvas_position_tk_widget = canvas_position.get_tk_widget()
-canvas_position_tk_widget.config(highlightthickness=0) # Set it here
-canvas_position_tk_widget.grid(row=0, column=0, sticky="nsew", padx=2, pady=2)
 
-# Remove axis labels and titles
+# Remove axis labels, keep a title in place of the former LabelFrame
 ax_position.set_xlabel("")
 ax_position.set_ylabel("")
 ax_position.set_zlabel("")
-ax_position.set_title("")
+ax_position.set_title("Position Trail", color=LIGHT_TEXT_COLOR, fontsize=10, fontweight='bold')
 ax_position.set_xticklabels([]) # Remove tick labels
 ax_position.set_yticklabels([])
 ax_position.set_zticklabels([])
 ax_position.tick_params(axis='both', which='major', length=0) # Remove tick marks
-ax_position.set_xlim([-10, 10])
-ax_position.set_ylim([-10, 10])
-ax_position.set_zlim([-10, 10])
+# Position limits shown while there is no trail, and the (x, y, z) limits the axes currently use
+DEFAULT_POSITION_LIMITS = ((-10, 10), (-10, 10), (-10, 10))
+position_limits_shown = DEFAULT_POSITION_LIMITS
+ax_position.set_xlim(DEFAULT_POSITION_LIMITS[0])
+ax_position.set_ylim(DEFAULT_POSITION_LIMITS[1])
+ax_position.set_zlim(DEFAULT_POSITION_LIMITS[2])
 ax_position.set_aspect('equal')
 ax_position.grid(False) # Remove grid
+strip_3d_axes(ax_position)
+
+# White line for trail, drawn as a single-polyline collection which projects and draws
+# faster than a Line3D when blitted
+line_position_trail = Line3DCollection([], colors='w', linewidths=1, animated=True)
+ax_position.add_collection3d(line_position_trail, autolim=False)
 
-line_position_trail, = ax_position.plot([], [], [], 'w-', lw=1) # White line for trail
+# Adjust subplot parameters for a tight layout
+fig_plots.tight_layout()
 
-# Adjust subplot parameters for a tight layout for each figure
-fig_attitude.tight_layout()
-fig_position.tight_layout()
+# Cached static backgrounds of each plot for blitting, captured after every full draw of the figure
+bg_attitude = None
+bg_position = None
+plots_draw_pending = False # A full draw has been queued and not yet run; blits wait for it
 
 
 #
@@ -522,11 +689,11 @@ def send_typed_command():
             try:
                 # Send the command followed by a newline character
                 ser.write((command_text + '\n').encode('utf-8'))
-                print(f"[DEBUG] Sent command: {command_text}")
+                log.info("Sent command: %s", command_text)
                 command_entry.delete(0, tk.END) # Clear the entry field after sending
             except Exception as e:
                 messagebox.showerror("Send Error", f"Failed to send command: {e}")
-                traceback.print_exc()
+                log.exception("Failed to send command")
         else:
             messagebox.showwarning("No Command", "Please type a command to send.")
     else:
@@ -537,183 +704,502 @@ send_typed_command_button.grid(row=2, column=1, padx=5, pady=5, sticky="ew")
 
 
 # --- Functions ---
+# Only the three basis axes are rotated today, which needs no matrix products at all. If the
+# attitude view ever rotates more points (e.g. a vehicle outline), build the 3x3 matrix from the
+# same closed-form entries once per frame and apply it to the (N, 3) points as `points @ matrix.T`;
+# np.matmul is about twice as fast as an einsum-based apply (as in SciPy's Rotation.apply()).
+def quat_to_basis_vectors(q):
+    """
+    Returns the rotated x, y and z unit axes for a unit quaternion given in [x, y, z, w] order
+    (incoming quaternions are normalized once on receipt by parse_data_line).
+    These are the columns of the quaternion's rotation matrix, so they are assembled
+    directly from the closed-form entries as tuples of floats, without building the
+    3x3 matrix or any NumPy arrays.
+    """
+    x, y, z, w = q
+    # Doubling x, y and z once up front leaves one multiply per product term (9 in total)
+    x2, y2, z2 = x + x, y + y, z + z
+    xx, yy, zz = x*x2, y*y2, z*z2
+    xy, xz, yz = x*y2, x*z2, y*z2
+    wx, wy, wz = w*x2, w*y2, w*z2
+
+    return (
+        (1 - (yy + zz), xy + wz, xz - wy),
+        (xy - wz, 1 - (xx + zz), yz + wx),
+        (xz + wy, yz - wx, 1 - (xx + yy))
+    )
+
+# Arrowhead half-angle used by Axes3D.quiver
+ARROW_HEAD_COS = math.cos(math.radians(15))
+ARROW_HEAD_SIN = math.sin(math.radians(15))
+
+def arrow_segments(u, v, w, out):
+    """
+    Writes the shaft and two arrowhead segments for an attitude arrow from the origin
+    along the unit vector (u, v, w) into out, a (3, 2, 3) slice of attitude_segments,
+    laid out the same way Axes3D.quiver builds them. The origin points in out are left
+    untouched, as they never move.
+    """
+    tip = (u * ARROW_LENGTH, v * ARROW_LENGTH, w * ARROW_LENGTH)
+
+    # Arrowheads are rotated +/-15 degrees about a horizontal axis perpendicular to the arrow
+    horizontal_norm = math.hypot(u, v)
+    if horizontal_norm:
+        px, py = v / horizontal_norm, -u / horizontal_norm
+    else:
+        px, py = 0.0, 1.0
+    cx, cy, cz = py * w, -px * w, px * v - py * u
+
+    head_length = ARROW_LENGTH * ARROW_HEAD_RATIO
+    along = head_length * ARROW_HEAD_COS
+    across = head_length * ARROW_HEAD_SIN
+    back = (tip[0] - along * u, tip[1] - along * v, tip[2] - along * w)
+
+    out[:, 0] = tip # All three segments start at the tip
+    out[1, 1] = (back[0] - across * cx, back[1] - across * cy, back[2] - across * cz)
+    out[2, 1] = (back[0] + across * cx, back[1] + across * cy, back[2] + across * cz)
+
+# Enumerating ports scans the OS device tables, so results are reused for a short while
+PORT_LIST_TTL = 2.0 # Seconds a port scan stays valid
+port_list_cache = (None, 0.0) # (ports, time.monotonic() of the scan), replaced as a whole
+
 def list_serial_ports():
-    """Lists available serial ports."""
-    ports = serial.tools.list_ports.comports()
-    return [p.device for p in ports]
+    """Lists available serial ports, rescanning only if the last scan is older than PORT_LIST_TTL."""
+    global port_list_cache
+    ports, scanned_at = port_list_cache
+    now = time.monotonic()
+    if ports is None or now - scanned_at > PORT_LIST_TTL:
+        ports = [p.device for p in serial.tools.list_ports.comports()]
+        port_list_cache = (ports, now)
+    return ports
 
 def refresh_ports():
-    """Refreshes the list of serial ports in the combobox."""
+    """Refreshes the list of serial ports in the combobox. Runs whenever its dropdown opens."""
     port_combo["values"] = list_serial_ports()
 
+def load_ports_in_background():
+    """Scans the serial ports off the Tk thread at startup and fills the combobox when done."""
+    ports = list_serial_ports()
+    root.after(0, lambda: port_combo.config(values=ports))
+
+# Matches a complete DATA line and captures its numeric payload, rejecting radio noise
+# before it reaches the float parser
+DATA_LINE_RE = re.compile(rb"DATA:([-+.,0-9eE ]+)")
+
+# Longest partial line read_serial carries over between reads. A valid DATA line is well
+# under 200 bytes, so anything longer is radio noise.
+MAX_PENDING_BYTES = 4096
+
+def parse_data_line(line, out_quat, out_pos):
+    """
+    Parses a raw "DATA:qW,qX,qY,qZ,x,y,z" line (bytes, already stripped) into preallocated arrays.
+    The quaternion is normalized and written to out_quat in [x, y, z, w] order, and the
+    position is written to out_pos.
+    Returns False if the line is not a DATA line and raises ValueError if it is malformed.
+    """
+    if not line.startswith(b"DATA:"):
+        return False
+
+    match = DATA_LINE_RE.fullmatch(line)
+    if match is None:
+        raise ValueError("unexpected characters in DATA line")
+
+    # Parse all comma-separated components of the payload in a single C-level call
+    values = np.fromstring(match.group(1), sep=",")
+    if values.size < 7:
+        raise ValueError(f"expected 7 values, got {values.size}")
+
+    # Normalize once here rather than on every render, in case the firmware's quaternion drifts
+    w, x, y, z = values[:4].tolist()
+    norm_sq = w*w + x*x + y*y + z*z
+    if norm_sq == 0:
+        raise ValueError("zero quaternion")
+    inv_norm = 1.0 / math.sqrt(norm_sq)
+
+    # Quaternion components arrive as [w, x, y, z].
+    # We convert from [w, x, y, z] to [x, y, z, w].
+    out_quat[0] = x * inv_norm
+    out_quat[1] = y * inv_norm
+    out_quat[2] = z * inv_norm
+    out_quat[3] = w * inv_norm
+    out_pos[:] = values[4:7]
+    return True
+
+def notify_gui():
+    """
+    Wakes the GUI thread after the serial thread stored new data. At most one <<SerialData>>
+    event is in flight at a time; data arriving while it is pending is picked up by the
+    same update.
+    """
+    global serial_event_pending
+    if not serial_event_pending:
+        serial_event_pending = True
+        root.event_generate("<<SerialData>>", when="tail")
+
 def read_serial():
     """
-    Reads data from the serial port in a separate thread.
+    Reads data from the serial port in a separate thread, splitting buffered chunks into lines.
     Parses quaternion and position data and stores them.
     Expected format: "DATA:qW,qX,qY,qZ,x,y,z"
     """
-    global ser, running, start_time, engine_states, raw_serial_lines
+    global ser, running, start_time, engine_states, attitude_dirty, position_dirty, engines_dirty
     # Ensure start_time is set only once when the thread truly starts reading
     if start_time is None:
         start_time = time.time()
+
+    # Preallocated buffers the parser writes into, reused for every line
+    parsed_quat = np.empty(4, dtype=np.float32)
+    parsed_pos = np.empty(3, dtype=np.float32)
+
+    # Timer for the placeholder engine toggle below, kept local to avoid attribute lookups per line
+    last_toggle_time = time.monotonic()
+
+    # Bytes received after the last complete line, carried over to the next read
+    pending = b""
+
     while running:
         try:
-            line = ser.readline() # Read a line from the serial port
-            if not line:
+            # Read everything the driver has buffered in one call instead of one byte at a
+            # time; when idle this blocks for up to the port timeout waiting for a byte
+            chunk = ser.read(ser.in_waiting or 1)
+            if chunk:
+                *lines, pending = (pending + chunk).split(b"\n")
+                if len(pending) > MAX_PENDING_BYTES:
+                    # Noise without line breaks; drop it rather than let the carry-over grow
+                    log.warning("Dropped %d bytes received without a line break", len(pending))
+                    pending = b""
+            elif pending:
+                # The read timed out mid-line: hand the partial line on, as readline() did
+                lines, pending = [pending], b""
+            else:
                 continue # Skip if no data
-            decoded_line = line.decode("utf-8", errors="ignore").strip() # Decode and clean the line
-            raw_serial_lines.append(decoded_line) # Store the raw line
 
-            # Check if the line starts with "DATA:"
-            if decoded_line.startswith("DATA:"):
+            for line in lines:
+                line = line.strip()
+                if not line:
+                    continue # Skip empty lines
                 try:
-                    parts = decoded_line.split(":")
-                    data_str = parts[1].split(",") # Split all data components by comma
-                    
-                    # Parse quaternion components
-                    qW = float(data_str[0])
-                    qX = float(data_str[1])
-                    qY = float(data_str[2])
-                    qZ = float(data_str[3])
-
-                    # SciPy's Rotation.from_quat() expects [x, y, z, w] order.
-                    # We convert from [w, x, y, z] to [x, y, z, w].
-                    latest_quaternion.append(np.array([qX, qY, qZ, qW]))
-
-                    # Parse position components
-                    x_pos = float(data_str[4])
-                    y_pos = float(data_str[5])
-                    z_pos = float(data_str[6])
-                    
-                    x_positions.append(x_pos)
-                    y_positions.append(y_pos)
-                    z_positions.append(z_pos)
-
-                    # --- Placeholder for Engine State Update (Example) ---
-                    # In a real scenario, you'd parse engine states from serial data.
-                    # For demonstration, let's toggle engine 0 every 5 seconds of flight time.
-                    # This will now toggle the first of the three engines.
-                    if int(time.time() - start_time) % 5 == 0 and int(time.time() - start_time) != 0:
-                        if not hasattr(read_serial, 'last_toggle_time'):
-                            read_serial.last_toggle_time = 0
-                        if time.time() - read_serial.last_toggle_time > 5:
-                            engine_states[0] = not engine_states[0]
-                            read_serial.last_toggle_time = time.time()
-
+                    raw_line_queue.put_nowait(line) # Hand the raw line to the GUI, which decodes it for display
+                except queue.Full:
+                    pass # The display is only a convenience, drop the line rather than stall the reader
 
+                try:
+                    is_data_line = parse_data_line(line, parsed_quat, parsed_pos)
                 except (ValueError, IndexError):
-                    print(f"[ERROR] Could not parse data from line: {decoded_line}. Expected DATA:qW,qX,qY,qZ,x,y,z")
-            else:
-                # Optionally handle other types of serial data or log unparsed lines
-                pass
+                    log.error("Could not parse data from line: %s. Expected DATA:qW,qX,qY,qZ,x,y,z",
+                              line.decode("utf-8", errors="ignore"))
+                    continue
+
+                if is_data_line:
+                    now = time.monotonic() # Single clock read per data line
+                    with telemetry_lock:
+                        if not np.array_equal(latest_quaternion, parsed_quat):
+                            latest_quaternion[:] = parsed_quat
+                            attitude_dirty = True
+                        position_trail.append(parsed_pos)
+                        position_dirty = True
+
+                        # --- Placeholder for Engine State Update (Example) ---
+                        # In a real scenario, you'd parse engine states from serial data.
+                        # For demonstration, let's toggle engine 0 every 5 seconds of flight time.
+                        # This will now toggle the first of the three engines.
+                        if now - last_toggle_time >= 5:
+                            engine_states ^= 1 << 0
+                            engines_dirty = True
+                            last_toggle_time = now
+                else:
+                    # Optionally handle other types of serial data or log unparsed lines
+                    pass
+
+            if lines:
+                notify_gui()
         except Exception:
-            print("Serial read error:")
-            traceback.print_exc() # Print full traceback for debugging
+            log.exception("Serial read error") # Logs the full traceback for debugging
 
-def update_plot():
+def get_telemetry_snapshot():
     """
-    Updates the 3D attitude plot, 3D position trail plot, and telemetry data display.
-    This function is called periodically by the Tkinter event loop.
+    Returns a TelemetryFrame with what changed in the telemetry since the last snapshot,
+    or None if nothing did. Everything is read in one pass under the lock, so the serial
+    thread can keep writing while the frame is drawn.
+    The trail is copied into trail_snapshot, which only the GUI thread touches.
+    """
+    global attitude_dirty, position_dirty, engines_dirty
+    with telemetry_lock:
+        if not (attitude_dirty or position_dirty or engines_dirty):
+            return None
+
+        frame = TelemetryFrame(None, None, None, None)
+        if attitude_dirty:
+            frame.quaternion = latest_quaternion.tolist()
+        if position_dirty:
+            frame.trail = trail_snapshot[:, :len(position_trail)]
+            frame.trail[:] = position_trail.ordered()
+            frame.trail_bounds = position_trail.bounds()
+        if engines_dirty:
+            frame.engine_states = engine_states
+        attitude_dirty = position_dirty = engines_dirty = False
+    return frame
+
+def set_position_limits(limits):
+    """
+    Applies ((xmin, xmax), (ymin, ymax), (zmin, zmax)) limits to the position plot if they
+    differ from the ones shown, since every set_*lim call invalidates the axes transforms.
+    Returns True if the limits changed.
+    """
+    global position_limits_shown
+    if limits == position_limits_shown:
+        return False
+    (xmin, xmax), (ymin, ymax), (zmin, zmax) = limits
+    ax_position.set_xlim(xmin, xmax)
+    ax_position.set_ylim(ymin, ymax)
+    ax_position.set_zlim(zmin, zmax)
+    position_limits_shown = limits
+    return True
+
+def update_telemetry_plots(frame):
     """
-    global quiver_x, quiver_y, quiver_z, line_position_trail
+    Updates the attitude arrows and the position trail from a TelemetryFrame and redraws
+    them. Parts of the frame that are None are left as they are and not redrawn.
+    """
+    quaternion, trail, trail_bounds = frame.quaternion, frame.trail, frame.trail_bounds
+    # --- Update Attitude Plot ---
+    if quaternion is not None:
+        try:
+            # The rotated basis vectors are the rotation matrix columns, taken in x, y, z order
+            for i, axis in enumerate(quat_to_basis_vectors(quaternion)):
+                arrow_segments(*axis, attitude_segments[3 * i:3 * i + 3])
+            attitude_arrows.set_segments(attitude_segments) # Same array, marks the collection stale
 
-    # Update current date and time
-    current_time = time.strftime("%H:%M:%S")
-    current_date = time.strftime("%Y-%m-%d")
-    date_label.config(text=f"Date: {current_date}")
-    time_label.config(text=f"Time: {current_time}")
+        except Exception:
+            log.exception("Error updating attitude plot")
+
+    # --- Update Position Plot ---
+    limits_changed = False
+    if trail is not None and trail.shape[1]:
+        try:
+            line_position_trail.set_segments([trail.T]) # One polyline of (x, y, z) points
+
+            # Dynamically adjust limits for the position plot
+            if trail.shape[1] > 1:
+                mins, maxs = trail_bounds
+
+                # Snap the buffered limits outwards to whole units so small movements
+                # inside the current box leave the axes untouched
+                buffer = 1.0
+                limits_changed = set_position_limits(tuple(
+                    (math.floor(lo - buffer), math.ceil(hi + buffer)) for lo, hi in zip(mins.tolist(), maxs.tolist())))
+            else:
+                limits_changed = set_position_limits(DEFAULT_POSITION_LIMITS)
+
+        except Exception:
+            log.exception("Error updating position plot")
+
+    # Redraw only the animated artists, unless the position limits moved and the
+    # cached background no longer matches the axes
+    if limits_changed:
+        request_plots_draw() # The full redraw also redraws the animated artists
+    else:
+        if quaternion is not None:
+            blit_attitude()
+        if trail is not None:
+            blit_position()
+
+# Text last applied to labels updated every tick, so unchanged text does not trigger a Tk re-layout
+label_text_cache = {}
+last_clock_second = None # Wall clock second currently shown in the date/time labels
+
+def set_label_text(label, text):
+    """Sets a label's text only if it differs from what the label currently shows."""
+    if label_text_cache.get(label) != text:
+        label.config(text=text)
+        label_text_cache[label] = text
+
+def update_clock():
+    """Updates the date, time and flight time labels. Reschedules itself every CLOCK_INTERVAL_MS."""
+    global last_clock_second
+
+    # Update current date and time, formatting them only once per second
+    now = time.time()
+    if int(now) != last_clock_second:
+        last_clock_second = int(now)
+        current_date_time = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        set_label_text(date_label, f"Date: {current_date_time[:10]}")
+        set_label_text(time_label, f"Time: {current_date_time[11:]}")
 
     # Update Flight Time
     if start_time is not None and running:
-        elapsed_time_s = time.time() - start_time
-        hours, remainder = divmod(elapsed_time_s, 3600)
+        hours, remainder = divmod(int(now - start_time), 3600)
         minutes, seconds = divmod(remainder, 60)
-        flight_time_value_label.config(text=f"{int(hours):02}:{int(minutes):02}:{int(seconds):02}")
+        set_label_text(flight_time_value_label, f"{hours:02}:{minutes:02}:{seconds:02}")
     else:
-        flight_time_value_label.config(text="00:00:00")
+        set_label_text(flight_time_value_label, "00:00:00")
 
+    # Report errors dropped by the rate limiter once their burst has ended
+    rate_limited_handler.flush()
 
-    # --- Update Attitude Plot ---
-    if latest_quaternion:
-        q_scipy_format = latest_quaternion[0]
-        try:
-            rot = R.from_quat(q_scipy_format)
-            rot_matrix = rot.as_matrix()
-
-            transformed_x = rot_matrix @ initial_vectors['x']
-            transformed_y = rot_matrix @ initial_vectors['y']
-            transformed_z = rot_matrix @ initial_vectors['z']
-
-            if quiver_x:
-                quiver_x.remove()
-                quiver_y.remove()
-                quiver_z.remove()
-
-            quiver_x = ax_attitude.quiver(0, 0, 0, transformed_x[0], transformed_x[1], transformed_x[2],
-                                 color='r', length=0.8, arrow_length_ratio=0.1)
-            quiver_y = ax_attitude.quiver(0, 0, 0, transformed_y[0], transformed_y[1], transformed_y[2],
-                                 color='g', length=0.8, arrow_length_ratio=0.1)
-            quiver_z = ax_attitude.quiver(0, 0, 0, transformed_z[0], transformed_z[1], transformed_z[2],
-                                 color='b', length=0.8, arrow_length_ratio=0.1)
-            
-        except Exception as e:
-            print(f"Error updating attitude plot: {e}")
-            traceback.print_exc()
+    root.after(CLOCK_INTERVAL_MS, update_clock)
 
-    # --- Update Position Plot ---
-    if x_positions and y_positions and z_positions:
-        try:
-            line_position_trail.set_data(list(x_positions), list(y_positions))
-            line_position_trail.set_3d_properties(list(z_positions))
+def on_serial_data(event):
+    """Handles the <<SerialData>> event posted by the serial thread."""
+    global serial_event_pending
+    serial_event_pending = False # Cleared first, so data arriving from now on posts a new event
+    schedule_update()
 
-            # Dynamically adjust limits for the position plot
-            if len(x_positions) > 1:
-                min_x, max_x = min(x_positions), max(x_positions)
-                min_y, max_y = min(y_positions), max(y_positions)
-                min_z, max_z = min(z_positions), max(z_positions)
+def schedule_update():
+    """
+    Schedules update_plot for the next idle moment of the Tk event loop, or for when
+    UPDATE_MIN_INTERVAL has passed since the last update. Repeated calls before it runs
+    are coalesced.
+    """
+    global update_scheduled
+    if update_scheduled:
+        return
+    update_scheduled = True
+    delay = UPDATE_MIN_INTERVAL - (time.monotonic() - last_update_time)
+    if delay > 0:
+        root.after(math.ceil(delay * 1000), update_plot)
+    else:
+        root.after_idle(update_plot)
 
-                buffer = 1.0
-                ax_position.set_xlim([min_x - buffer, max_x + buffer])
-                ax_position.set_ylim([min_y - buffer, max_y + buffer])
-                ax_position.set_zlim([min_z - buffer, max_z + buffer])
-            else:
-                ax_position.set_xlim([-10, 10])
-                ax_position.set_ylim([-10, 10])
-                ax_position.set_zlim([-10, 10])
+def update_plot():
+    """
+    Updates the 3D attitude plot, 3D position trail plot, and telemetry data display.
+    This function is scheduled by schedule_update when the serial thread signals new data.
+    Each section is only touched when its data changed since the previous call.
+    """
+    global update_scheduled, last_update_time
+    update_scheduled = False
+    last_update_time = time.monotonic()
 
-        except Exception as e:
-            print(f"Error updating position plot: {e}")
-            traceback.print_exc()
+    frame = get_telemetry_snapshot()
+    if frame is not None:
+        # --- Update Attitude and Position Plots ---
+        update_telemetry_plots(frame)
 
-    # --- Update Engine Visuals ---
-    update_engine_visuals()
+        # --- Update Engine Visuals ---
+        if frame.engine_states is not None:
+            update_engine_visuals(frame.engine_states)
 
     # --- Update Raw Serial Data Display ---
     update_raw_serial_display()
 
-    # Redraw both canvases
-    canvas_attitude.draw_idle()
-    canvas_position.draw_idle()
+    # Raw lines held back by the display throttle need another pass once it expires
+    if not raw_line_queue.empty():
+        schedule_update()
+
+def draw_attitude_artists():
+    """Draws the attitude arrows onto the plot canvas renderer."""
+    attitude_arrows.do_3d_projection() # Project with the view matrix from the last full draw
+    ax_attitude.draw_artist(attitude_arrows)
+
+def draw_position_artists():
+    """Draws the position trail onto the plot canvas renderer."""
+    line_position_trail.do_3d_projection() # Project with the view matrix from the last full draw
+    ax_position.draw_artist(line_position_trail)
+
+def request_plots_draw():
+    """
+    Queues a full redraw of the plot figure. Repeated requests before the draw runs are
+    coalesced into the one already queued.
+    """
+    global plots_draw_pending
+    if not plots_draw_pending:
+        plots_draw_pending = True
+        canvas_plots.draw_idle()
+
+def blit_attitude():
+    """Restores the cached attitude background and blits the arrows on top of it."""
+    if bg_attitude is None or plots_draw_pending:
+        return # No usable background until the next full draw
+    canvas_plots.restore_region(bg_attitude)
+    draw_attitude_artists()
+    canvas_plots.blit(ax_attitude.bbox)
+
+def blit_position():
+    """Restores the cached position background and blits the trail on top of it."""
+    if bg_position is None or plots_draw_pending:
+        return # No usable background until the next full draw
+    canvas_plots.restore_region(bg_position)
+    draw_position_artists()
+    canvas_plots.blit(ax_position.bbox)
+
+def on_plots_draw(event):
+    """Re-captures both plot backgrounds after a full draw and redraws the animated artists."""
+    global bg_attitude, bg_position, plots_draw_pending
+    plots_draw_pending = False
+    bg_attitude = canvas_plots.copy_from_bbox(ax_attitude.bbox)
+    bg_position = canvas_plots.copy_from_bbox(ax_position.bbox)
+    draw_attitude_artists()
+    draw_position_artists()
+
+def on_plots_resize(event):
+    """
+    Drops the cached plot backgrounds when the canvas is resized. Until the full redraw
+    queued by the resize re-captures them, blitting is skipped rather than restoring
+    backgrounds of the old size onto the new canvas.
+    """
+    global bg_attitude, bg_position
+    bg_attitude = None
+    bg_position = None
 
-    # Schedule the next plot update after 50 milliseconds for smoother animation
-    root.after(50, update_plot)
+# On/off state each engine circle currently shows (None until first drawn)
+engine_states_shown = [None, None, None]
 
-def update_engine_visuals():
+def update_engine_visuals(states):
+    """
+    Recolors only the engine circles whose on/off state in the states bitmask changed
+    since they were last drawn.
+    """
     for i in range(3):
-        color = ACCENT_GREEN if engine_states[i] else DARK_BG_COLOR
-        engine_canvas.itemconfigure(f"eng{i}", fill=color)
+        state = (states >> i) & 1
+        if state != engine_states_shown[i]:
+            color = ACCENT_GREEN if state else DARK_BG_COLOR
+            engine_canvas.itemconfigure(engine_item_ids[i], fill=color)
+            engine_states_shown[i] = state
+
+def update_engine_metrics():
+    """Updates the engine metric labels from engine_telemetry. Unchanged labels are not touched."""
+    for i, (servo1, servo2, throttle, thrust) in enumerate(
+            engine_telemetry[['servo1', 'servo2', 'throttle', 'thrust']].tolist()):
+        set_label_text(servo_angle1_labels[i], f"{servo1:.0f}°")
+        set_label_text(servo_angle2_labels[i], f"{servo2:.0f}°")
+        set_label_text(throttle_labels[i], f"{throttle:.0f}%")
+        set_label_text(thrust_labels[i], f"{thrust:.0f} N")
+
+def drain_raw_line_queue():
+    """Returns all raw lines queued by the serial thread since the last call."""
+    lines = []
+    while True:
+        try:
+            lines.append(raw_line_queue.get_nowait())
+        except queue.Empty:
+            return lines
 
 def update_raw_serial_display():
-    """Updates the raw serial data text widget with the latest lines."""
+    """
+    Appends the raw lines received since the last refresh to the text widget in a single
+    insert and trims the oldest lines, instead of rewriting the whole widget.
+    Refreshes are throttled to RAW_DISPLAY_INTERVAL independently of the line rate.
+    """
+    global last_raw_display_time, raw_lines_shown
+    if raw_line_queue.empty():
+        return # Nothing new from the serial thread; the queue doubles as the display's dirty flag
+    now = time.monotonic()
+    if now - last_raw_display_time < RAW_DISPLAY_INTERVAL:
+        return
+    last_raw_display_time = now
+
     # Only update if there's new data
-    if raw_serial_lines:
+    new_lines = drain_raw_line_queue()
+    if new_lines:
         raw_data_text.config(state="normal") # Enable editing temporarily
-        raw_data_text.delete("1.0", tk.END) # Clear existing text
-
-        # Insert all lines from the deque
-        for line in raw_serial_lines:
-            raw_data_text.insert(tk.END, line + "\n")
-        
+        # Decode the whole batch of raw lines at once
+        raw_data_text.insert(tk.END, b"\n".join(new_lines).decode("utf-8", errors="ignore") + "\n")
+        raw_lines_shown += len(new_lines)
+        overflow = raw_lines_shown - RAW_DISPLAY_MAX_LINES
+        if overflow > 0:
+            raw_data_text.delete("1.0", f"{overflow + 1}.0") # Drop only the oldest lines beyond the limit
+            raw_lines_shown = RAW_DISPLAY_MAX_LINES
         raw_data_text.see(tk.END) # Scroll to the bottom
         raw_data_text.config(state="disabled") # Disable editing
 
@@ -750,13 +1236,13 @@ def connect_serial():
         start_time = time.time() # Set start time when connected
     except Exception as e:
         messagebox.showerror("Connection Failed", str(e))
-        traceback.print_exc()
+        log.exception("Connection failed")
 
 def disconnect_serial():
     """
     Closes the serial connection and resets GUI elements and plot data.
     """
-    global ser, running, start_time
+    global ser, running, start_time, engine_states, attitude_dirty, position_dirty, engines_dirty, raw_lines_shown
     if ser and ser.is_open:
         running = False
         ser.close()
@@ -773,44 +1259,48 @@ def disconnect_serial():
     
     # Reset flight time
     start_time = None
-    flight_time_value_label.config(text="00:00:00")
+    set_label_text(flight_time_value_label, "00:00:00")
 
     # Reset plots to default
-    latest_quaternion.clear()
-    latest_quaternion.append(np.array([0, 0, 0, 1])) # Reset attitude to no rotation
-    
-    x_positions.clear()
-    y_positions.clear()
-    z_positions.clear()
+    with telemetry_lock:
+        latest_quaternion[:] = (0.0, 0.0, 0.0, 1.0) # Reset attitude to no rotation
+        position_trail.clear()
+        engine_states = 0 # Reset engine states
+        attitude_dirty = position_dirty = engines_dirty = True
     
     # Reset position plot line
-    line_position_trail.set_data([], [])
-    line_position_trail.set_3d_properties([])
-    ax_position.set_xlim([-10, 10]) # Reset position plot limits
-    ax_position.set_ylim([-10, 10])
-    ax_position.set_zlim([-10, 10])
+    line_position_trail.set_segments([])
+    set_position_limits(DEFAULT_POSITION_LIMITS) # Reset position plot limits
 
-    # Reset engine states
-    for i in range(len(engine_states)):
-        engine_states[i] = False
-    update_engine_visuals() # Immediately update the display
+    # Reset engine states and metrics
+    engine_telemetry[:] = 0
+    update_engine_visuals(0) # Immediately update the display
+    update_engine_metrics()
 
     # Clear raw serial data display
-    raw_serial_lines.clear()
+    drain_raw_line_queue()
     raw_data_text.config(state="normal")
     raw_data_text.delete("1.0", tk.END)
+    raw_lines_shown = 0
     raw_data_text.config(state="disabled")
 
-    canvas_attitude.draw_idle() # Redraw to clear old vectors
-    canvas_position.draw_idle() # Redraw to clear old trail
+    request_plots_draw() # Redraw to clear old vectors and trail
+    schedule_update() # Show the reset attitude, which no serial data will trigger
 
 # --- Main Application Flow ---
-refresh_ports() # Populate ports when the application starts
+# Populate ports without delaying the window, then keep them current whenever the dropdown opens
+threading.Thread(target=load_ports_in_background, daemon=True).start()
+port_combo.config(postcommand=refresh_ports)
 connect_button.config(command=connect_serial) # Assign command to connect button
 disconnect_button.config(state="disabled") # Disable disconnect button initially
 set_command_control_states("disabled") # Disable command controls initially
+canvas_plots.mpl_connect('draw_event', on_plots_draw) # Keep blitting backgrounds in sync with full draws
+canvas_plots.mpl_connect('resize_event', on_plots_resize) # Invalidate backgrounds until the resize redraw
+root.bind("<<SerialData>>", on_serial_data) # Update the GUI whenever the serial thread has new data
 
-# Start the periodic update for the plot and data display
+# Draw the initial state and start the clock
 update_plot()
+update_engine_metrics()
+update_clock()
 
 root.mainloop()
\ No newline at end of file